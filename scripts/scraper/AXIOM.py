@@ -16,17 +16,23 @@ Copyright (c) 2024 - Production Ready
 import json
 import time
 import aiohttp
+import aiofiles
 import asyncio
 from bs4 import BeautifulSoup
+import soupsieve
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from typing import Set, List, Dict, Optional, Tuple
+import logging.handlers
+import queue
+import atexit
+from typing import Set, List, Dict, Optional, Tuple, Iterable, Union
 import csv
 from pathlib import Path
 import re
 from dataclasses import dataclass, asdict
 import sys
 import os
+import ntpath
 import zipfile
 import rarfile
 import py7zr
@@ -35,7 +41,10 @@ import hashlib
 from datetime import datetime
 import sqlite3
 from contextlib import contextmanager
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import signal
+import threading
 
 # Animation imports (optional)
 try:
@@ -45,6 +54,32 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
+# JIT compilation for hot numeric helpers (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# C-backed HTML parser (optional)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Fast JSON parsing (optional)
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+# Maps characters invalid in Windows filenames (and control chars) to '_'
+_FILENAME_TRANSLATION = str.maketrans(
+    {c: '_' for c in '<>:"/\\|?*' + ''.join(map(chr, range(32)))}
+)
+
 
 # ============================================================================
 # DATA MODELS
@@ -100,23 +135,88 @@ class SkinMetadata:
 class SkinDatabase:
     """SQLite database for efficient skin storage"""
     
-    def __init__(self, db_path: Path):
+    _INSERT_SQL = """
+        INSERT OR REPLACE INTO skins VALUES (
+            :url, :title, :category, :category_url, :page_number,
+            :author, :description, :download_url, :download_filename,
+            :file_size, :downloads_count, :rating, :tags, :screenshots,
+            :created_date, :updated_date, :version, :compatibility,
+            :scraped_at, :download_status, :local_path, :extracted_path,
+            :file_hash
+        )
+    """
+    _SELECT_SQL = "SELECT * FROM skins WHERE url = ?"
+    # Fixed statement text so sqlite3's statement cache prepares it only once;
+    # columns left as NULL keep their stored value
+    _UPDATE_STATUS_SQL = """
+        UPDATE skins SET
+            download_status = ?,
+            local_path = COALESCE(?, local_path),
+            extracted_path = COALESCE(?, extracted_path),
+            file_hash = COALESCE(?, file_hash)
+        WHERE url = ?
+    """
+    _UPDATE_STATUS_FIELDS = ('local_path', 'extracted_path', 'file_hash')
+    
+    _PENDING_SQL = """
+        SELECT * FROM skins
+        WHERE download_status = 'pending' AND download_url != ''
+        LIMIT ?
+    """
+    
+    # Write-optimized settings applied to the connection in fast mode
+    _FAST_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+    )
+    
+    def __init__(self, db_path: Union[Path, str], fast_mode: bool = False, uri: bool = False):
+        """Open db_path, or an SQLite URI such as 'file::memory:?cache=shared' when uri=True"""
         self.db_path = db_path
+        self.fast_mode = fast_mode
+        
+        # One long-lived connection so sqlite3's statement cache is reused
+        # across calls; the lock serializes the scraper's loop and DB threads
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False, uri=uri
+        )
+        self._conn.row_factory = sqlite3.Row
+        if fast_mode:
+            for pragma in self._FAST_PRAGMAS:
+                self._conn.execute(pragma)
+        
         self.init_database()
     
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager yielding the shared connection inside a transaction"""
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+            
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
     
     def init_database(self):
         """Initialize database schema"""
@@ -153,81 +253,98 @@ class SkinDatabase:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_category ON skins(category)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON skins(download_status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_download_url ON skins(download_url)")
+            
+            # Used by axiom_utilities stats (top authors, most recently scraped)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_author ON skins(author)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_scraped_at ON skins(scraped_at DESC)")
+    
+    @staticmethod
+    def _skin_params(skin: SkinMetadata) -> Dict:
+        """Convert skin to insert parameters with list fields JSON-encoded"""
+        skin_dict = asdict(skin)
+        for field in ['tags', 'screenshots']:
+            if isinstance(skin_dict[field], list):
+                skin_dict[field] = json.dumps(skin_dict[field])
+        return skin_dict
     
     def save_skin(self, skin: SkinMetadata) -> bool:
         """Save or update skin metadata"""
         try:
-            skin_dict = asdict(skin)
-            for field in ['tags', 'screenshots']:
-                if isinstance(skin_dict[field], list):
-                    skin_dict[field] = json.dumps(skin_dict[field])
-            
-            with self.get_connection() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO skins VALUES (
-                        :url, :title, :category, :category_url, :page_number,
-                        :author, :description, :download_url, :download_filename,
-                        :file_size, :downloads_count, :rating, :tags, :screenshots,
-                        :created_date, :updated_date, :version, :compatibility,
-                        :scraped_at, :download_status, :local_path, :extracted_path,
-                        :file_hash
-                    )
-                """, skin_dict)
+            with self._lock:
+                self._conn.execute(self._INSERT_SQL, self._skin_params(skin))
             return True
         except Exception as e:
             logging.error(f"Failed to save skin {skin.url}: {e}")
             return False
     
+    def save_skins_many(self, skins: Iterable[SkinMetadata]) -> bool:
+        """Save or update many skins in a single transaction"""
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(self._INSERT_SQL, (self._skin_params(s) for s in skins))
+            return True
+        except Exception as e:
+            logging.error(f"Failed to bulk save skins: {e}")
+            return False
+    
     def get_skin(self, url: str) -> Optional[SkinMetadata]:
         """Retrieve skin by URL"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM skins WHERE url = ?", (url,))
-            row = cursor.fetchone()
-            if row:
-                return SkinMetadata(**dict(row))
+        with self._lock:
+            row = self._conn.execute(self._SELECT_SQL, (url,)).fetchone()
+        if row:
+            return SkinMetadata(**dict(row))
         return None
     
     def get_pending_downloads(self, limit: int = None) -> List[SkinMetadata]:
         """Get skins pending download"""
-        query = "SELECT * FROM skins WHERE download_status = 'pending' AND download_url != ''"
-        if limit:
-            query += f" LIMIT {limit}"
-        
+        with self._lock:
+            rows = self._conn.execute(self._PENDING_SQL, (limit or -1,)).fetchall()
+        return [SkinMetadata(**dict(row)) for row in rows]
+    
+    def get_urls_with_status(self, statuses: List[str]) -> Set[str]:
+        """Get URLs of skins in any of the given download statuses"""
+        placeholders = ', '.join('?' * len(statuses))
         with self.get_connection() as conn:
-            cursor = conn.execute(query)
-            return [SkinMetadata(**dict(row)) for row in cursor.fetchall()]
+            cursor = conn.execute(
+                f"SELECT url FROM skins WHERE download_status IN ({placeholders})",
+                statuses
+            )
+            return {row[0] for row in cursor}
     
     def update_download_status(self, url: str, status: str, **kwargs):
         """Update download status and related fields"""
-        fields = ["download_status = ?"]
-        values = [status]
-        
-        for key, value in kwargs.items():
-            fields.append(f"{key} = ?")
-            values.append(value)
-        
-        values.append(url)
+        self.update_download_status_many([(url, status, kwargs)])
+    
+    def update_download_status_many(self, updates: List[Tuple[str, str, Dict]]):
+        """Apply (url, status, fields) updates in a single transaction"""
+        params = []
+        for url, status, extra in updates:
+            unknown = extra.keys() - set(self._UPDATE_STATUS_FIELDS)
+            if unknown:
+                raise TypeError(f"Unsupported status fields: {', '.join(sorted(unknown))}")
+            params.append((
+                status,
+                *(extra.get(key) for key in self._UPDATE_STATUS_FIELDS),
+                url
+            ))
         
         with self.get_connection() as conn:
-            conn.execute(f"""
-                UPDATE skins SET {', '.join(fields)}
-                WHERE url = ?
-            """, values)
+            conn.executemany(self._UPDATE_STATUS_SQL, params)
     
     def get_statistics(self) -> Dict:
         """Get scraping statistics"""
         with self.get_connection() as conn:
             stats = {}
             
-            cursor = conn.execute("SELECT COUNT(*) FROM skins")
-            stats['total_skins'] = cursor.fetchone()[0]
-            
+            # One scan yields both the per-status breakdown and the total
             cursor = conn.execute("""
                 SELECT download_status, COUNT(*) 
                 FROM skins 
                 GROUP BY download_status
             """)
-            stats['by_status'] = dict(cursor.fetchall())
+            rows = cursor.fetchall()
+            stats['by_status'] = dict(rows)
+            stats['total_skins'] = sum(count for _, count in rows)
             
             cursor = conn.execute("""
                 SELECT category, COUNT(*) 
@@ -265,9 +382,30 @@ class SkinDatabase:
 # RATE LIMITING
 # ============================================================================
 
+def _apply_success_py(delay: float, min_delay: float, success_count: int, n: int,
+                      threshold: int, decay: float) -> Tuple[float, int]:
+    """Apply n successes to (delay, success_count); pure-Python reference"""
+    total = success_count + n
+    period = threshold + 1
+    decays = total // period
+    if decays:
+        delay = max(min_delay, delay * decay ** decays)
+    return delay, total % period
+
+
+# Compiled once and cached on disk so later runs skip the JIT warmup
+if NUMBA_AVAILABLE:
+    _apply_success = njit(cache=True)(_apply_success_py)
+else:
+    _apply_success = _apply_success_py
+
+
 class AdaptiveRateLimiter:
     """Smart rate limiting that adapts to server responses"""
     
+    SUCCESS_THRESHOLD = 10  # Delay decays once the streak exceeds this
+    SUCCESS_DECAY = 0.95
+    
     def __init__(self, initial_delay: float = 1.0, min_delay: float = 0.5, max_delay: float = 10.0):
         self.delay = initial_delay
         self.min_delay = min_delay
@@ -288,12 +426,21 @@ class AdaptiveRateLimiter:
     
     def on_success(self):
         """Called after successful request"""
-        self.success_count += 1
         self.consecutive_failures = 0
-        
-        if self.success_count > 10:
-            self.delay = max(self.min_delay, self.delay * 0.95)
-            self.success_count = 0
+        self.delay, self.success_count = _apply_success(
+            self.delay, self.min_delay, self.success_count, 1,
+            self.SUCCESS_THRESHOLD, self.SUCCESS_DECAY
+        )
+    
+    def on_success_batch(self, n: int):
+        """Apply n successes at once; equivalent to n on_success() calls"""
+        if n <= 0:
+            return
+        self.consecutive_failures = 0
+        self.delay, self.success_count = _apply_success(
+            self.delay, self.min_delay, self.success_count, n,
+            self.SUCCESS_THRESHOLD, self.SUCCESS_DECAY
+        )
     
     def on_rate_limit(self):
         """Called when rate limited (429)"""
@@ -321,19 +468,48 @@ class SecureExtractor:
     
     MAX_EXTRACT_SIZE = 2 * 1024 * 1024 * 1024  # 2GB per archive
     MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB per file
+    COPY_BUFFER_SIZE = 1 << 20  # 1MB, vs zipfile's small default
+    
+    # Characters Windows rejects in file names, mapped to '_' as zipfile does
+    WINDOWS_ILLEGAL_CHARS = str.maketrans(':<>|"?*', '_' * 7)
     
     def __init__(self, logger):
         self.logger = logger
     
-    def is_safe_path(self, base_path: Path, target_path: Path) -> bool:
-        """Check if extraction path is safe"""
+    @staticmethod
+    def resolved_prefix(path) -> str:
+        """Resolve path to a normalized string ending in a separator"""
+        return os.path.join(os.path.normcase(os.path.realpath(path)), '')
+    
+    def is_safe_path(self, base_path: Path, target_path: Path,
+                     base_prefix: Optional[str] = None) -> bool:
+        """Check if extraction path is safe; base_prefix skips re-resolving the base"""
         try:
-            base_resolved = base_path.resolve()
-            target_resolved = target_path.resolve()
-            return target_resolved.is_relative_to(base_resolved)
+            if base_prefix is None:
+                base_prefix = self.resolved_prefix(base_path)
+            return self.resolved_prefix(target_path).startswith(base_prefix)
         except (ValueError, OSError):
             return False
     
+    @staticmethod
+    def member_path(filename: str, sep: str = os.sep) -> str:
+        """Normalize a ZIP member name the way ZipFile.extract() does
+        
+        Drops drive letters, roots, '.', '..' and empty parts; with a Windows
+        separator also replaces illegal characters and strips trailing dots.
+        """
+        windows = sep == '\\'
+        arcname = filename.replace('/', sep)
+        if windows:
+            arcname = ntpath.splitdrive(arcname)[1]
+        parts = (part for part in arcname.split(sep) if part not in ('', '.', '..'))
+        if windows:
+            parts = (
+                part.translate(SecureExtractor.WINDOWS_ILLEGAL_CHARS).rstrip('.')
+                for part in parts
+            )
+        return sep.join(part for part in parts if part)
+    
     def extract_zip(self, archive_path: Path, extract_dir: Path) -> Tuple[bool, str]:
         """Securely extract ZIP file"""
         try:
@@ -343,13 +519,22 @@ class SecureExtractor:
             try:
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
                     total_size = 0
+                    base_prefix = self.resolved_prefix(temp_dir)
                     
-                    for member in zip_ref.namelist():
-                        target = temp_dir / member
-                        if not self.is_safe_path(temp_dir, target):
+                    for file_info in zip_ref.infolist():
+                        member = file_info.filename
+                        if not self.is_safe_path(temp_dir, temp_dir / member, base_prefix):
                             raise ValueError(f"Unsafe path detected: {member}")
                         
-                        file_info = zip_ref.getinfo(member)
+                        arcname = self.member_path(member)
+                        if not arcname:
+                            continue
+                        target = temp_dir / arcname
+                        
+                        if file_info.is_dir():
+                            target.mkdir(parents=True, exist_ok=True)
+                            continue
+                        
                         if file_info.file_size > self.MAX_FILE_SIZE:
                             self.logger.warning(f"Skipping large file: {member}")
                             continue
@@ -358,7 +543,9 @@ class SecureExtractor:
                         if total_size > self.MAX_EXTRACT_SIZE:
                             raise ValueError(f"Archive too large: {total_size} bytes")
                         
-                        zip_ref.extract(member, temp_dir)
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        with zip_ref.open(file_info) as src, open(target, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, self.COPY_BUFFER_SIZE)
                 
                 if extract_dir.exists():
                     shutil.rmtree(extract_dir)
@@ -387,10 +574,11 @@ class SecureExtractor:
             try:
                 with rarfile.RarFile(archive_path, 'r') as rar_ref:
                     total_size = 0
+                    base_prefix = self.resolved_prefix(temp_dir)
                     
                     for member in rar_ref.namelist():
                         target = temp_dir / member
-                        if not self.is_safe_path(temp_dir, target):
+                        if not self.is_safe_path(temp_dir, target, base_prefix):
                             raise ValueError(f"Unsafe path detected: {member}")
                         
                         file_info = rar_ref.getinfo(member)
@@ -456,7 +644,7 @@ class AsyncDownloader:
     """Async file downloader with progress tracking"""
     
     MAX_DOWNLOAD_SIZE = 500 * 1024 * 1024  # 500MB
-    CHUNK_SIZE = 8192
+    CHUNK_SIZE = 64 * 1024  # Each write is a thread-pool hop; keep them coarse
     
     def __init__(self, download_dir: Path, logger, rate_limiter: AdaptiveRateLimiter):
         self.download_dir = download_dir
@@ -464,11 +652,13 @@ class AsyncDownloader:
         self.rate_limiter = rate_limiter
         self.session = None
     
-    async def init_session(self):
-        """Initialize aiohttp session"""
+    async def init_session(self, connector: Optional[aiohttp.BaseConnector] = None):
+        """Initialize aiohttp session, optionally on a shared connector"""
         timeout = aiohttp.ClientTimeout(total=300, connect=30)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
+            connector=connector,
+            connector_owner=connector is None,
             headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
@@ -565,10 +755,12 @@ class AsyncDownloader:
                 downloaded = 0
                 hasher = hashlib.sha256()
                 
-                with open(local_path, 'wb') as f:
+                # aiofiles runs disk writes on the default executor so
+                # concurrent downloads don't serialize on the event loop
+                async with aiofiles.open(local_path, 'wb') as f:
                     async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
                         if chunk:
-                            f.write(chunk)
+                            await f.write(chunk)
                             hasher.update(chunk)
                             downloaded += len(chunk)
                 
@@ -587,12 +779,20 @@ class AsyncDownloader:
             self.logger.error(f"Unexpected error downloading {url}: {e}")
             return False, "", ""
     
+    async def download_many(self, items: Iterable[Tuple[str, str, str]],
+                            concurrency: int = 64) -> List[Tuple[bool, str, str]]:
+        """Download (url, category, skin_name) items with bounded concurrency"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded(url, category, skin_name):
+            async with semaphore:
+                return await self.download_file(url, category, skin_name)
+        
+        return await asyncio.gather(*(bounded(*item) for item in items))
+    
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        filename = filename[:100]
+        filename = filename.translate(_FILENAME_TRANSLATION)[:100]
         filename = filename.strip('. ')
         return filename if filename else "unnamed"
 
@@ -604,6 +804,21 @@ class AsyncDownloader:
 class MetadataExtractor:
     """Extract metadata from skin pages"""
     
+    # Selectors compiled once instead of on every page
+    _TITLE_SELECTORS = [
+        soupsieve.compile(s)
+        for s in ['h1.entry-title', 'h1.post-title', '.entry-header h1', 'h1', 'title']
+    ]
+    _DOWNLOAD_SELECTORS = [
+        soupsieve.compile(s)
+        for s in [
+            'a[href*="download"]', 'a[href*=".rmskin"]', 'a[href*=".zip"]',
+            'a[href*=".rar"]', '.download-btn', '.download-link', 'a[class*="download"]'
+        ]
+    ]
+    _DOWNLOAD_EXTENSIONS = ('.rmskin', '.zip', '.rar', '.7z')
+    _DOWNLOAD_INDICATORS = ('download', 'get', 'file')
+    
     def __init__(self, logger):
         self.logger = logger
     
@@ -638,9 +853,8 @@ class MetadataExtractor:
     
     def extract_title(self, soup: BeautifulSoup) -> str:
         """Extract title with multiple fallbacks"""
-        selectors = ['h1.entry-title', 'h1.post-title', '.entry-header h1', 'h1', 'title']
-        for selector in selectors:
-            element = soup.select_one(selector)
+        for selector in self._TITLE_SELECTORS:
+            element = selector.select_one(soup)
             if element:
                 title = element.get_text(strip=True)
                 if title and len(title) > 3:
@@ -673,12 +887,8 @@ class MetadataExtractor:
     
     def extract_download_url(self, soup: BeautifulSoup, base_url: str) -> str:
         """Extract download URL with validation"""
-        selectors = [
-            'a[href*="download"]', 'a[href*=".rmskin"]', 'a[href*=".zip"]',
-            'a[href*=".rar"]', '.download-btn', '.download-link', 'a[class*="download"]'
-        ]
-        for selector in selectors:
-            elements = soup.select(selector)
+        for selector in self._DOWNLOAD_SELECTORS:
+            elements = selector.select(soup)
             for element in elements:
                 href = element.get('href')
                 if href:
@@ -693,11 +903,9 @@ class MetadataExtractor:
             return False
         parsed = urlparse(url)
         path = parsed.path.lower()
-        download_extensions = ['.rmskin', '.zip', '.rar', '.7z']
-        if any(path.endswith(ext) for ext in download_extensions):
+        if path.endswith(self._DOWNLOAD_EXTENSIONS):
             return True
-        download_indicators = ['download', 'get', 'file']
-        if any(indicator in path for indicator in download_indicators):
+        if any(indicator in path for indicator in self._DOWNLOAD_INDICATORS):
             return True
         return False
     
@@ -812,11 +1020,13 @@ class AsyncScraper:
         self.session = None
         self.metadata_extractor = MetadataExtractor(logger)
     
-    async def init_session(self):
-        """Initialize session"""
+    async def init_session(self, connector: Optional[aiohttp.BaseConnector] = None):
+        """Initialize session, optionally on a shared connector"""
         timeout = aiohttp.ClientTimeout(total=60, connect=10)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
+            connector=connector,
+            connector_owner=connector is None,
             headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -845,7 +1055,7 @@ class AsyncScraper:
                 html = await response.text()
                 self.rate_limiter.on_success()
                 
-                return BeautifulSoup(html, 'html.parser')
+                return BeautifulSoup(html, HTML_PARSER)
                 
         except Exception as e:
             self.rate_limiter.on_error()
@@ -1062,6 +1272,8 @@ class AXIOMBranding:
 class EnhancedAXIOMScraper:
     """Main orchestrator for AXIOM scraper"""
     
+    TERMINAL_STATUSES = ['downloaded', 'extracted', 'invalid_url', 'download_failed']
+    
     def __init__(self, config_file: str, output_dir: str, delay: float = 1.0,
                  max_workers: int = 5, batch_size: int = 100):
         self.config_file = config_file
@@ -1082,6 +1294,7 @@ class EnhancedAXIOMScraper:
         
         # Load config
         self.config = self.load_config()
+        self._active_categories = self.get_active_categories()
         
         # Initialize components
         self.db = SkinDatabase(self.output_dir / "skins.db")
@@ -1090,23 +1303,34 @@ class EnhancedAXIOMScraper:
         self.downloader = AsyncDownloader(self.downloads_dir, self.logger, self.rate_limiter)
         self.extractor = SecureExtractor(self.logger)
         
-        # Statistics
-        self.stats = {
+        # Connection pool shared by discovery and download sessions;
+        # created in run() because aiohttp connectors need a running loop
+        self.connector = None
+        
+        # Statistics (written through update_stats, flushed once per batch)
+        self.stats = Counter({
             'categories_processed': 0,
             'skins_discovered': 0,
             'skins_downloaded': 0,
             'skins_extracted': 0,
             'download_failures': 0,
             'extraction_failures': 0
-        }
+        })
+        self._stats_lock = threading.Lock()
         
-        # Graceful shutdown
+        # Single writer thread keeps SQLite commits off the event loop
+        # without introducing writer contention
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # URLs already in a terminal download state, loaded on first use
+        self._seen_urls: Optional[Set[str]] = None
+        
+        # Graceful shutdown (handlers are installed by run() on its loop)
         self.shutdown_requested = False
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        self._download_tasks: Set[asyncio.Task] = set()
     
     def setup_logging(self):
-        """Setup logging"""
+        """Setup logging; handlers run on a background QueueListener thread"""
         log_file = self.output_dir / "axiom_scraper.log"
         
         formatter = logging.Formatter(
@@ -1121,25 +1345,67 @@ class EnhancedAXIOMScraper:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
         
+        # The event loop only enqueues records; file and console I/O
+        # happen on the listener thread
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     def load_config(self) -> Dict:
         """Load configuration"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _json.loads(Path(self.config_file).read_bytes())
             return config.get('rainmeterui_categories', config)
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
             raise
     
+    def get_active_categories(self) -> List[Dict]:
+        """Collect enabled categories that have a URL to scrape"""
+        categories = []
+        if 'primary_skin_categories' in self.config:
+            categories.extend(self.config['primary_skin_categories'])
+        if 'additional_categories' in self.config:
+            categories.extend(self.config['additional_categories'])
+        
+        active = [c for c in categories if c.get('enabled', True) and c.get('url')]
+        skipped = len(categories) - len(active)
+        if skipped:
+            self.logger.info(f"Skipping {skipped} disabled or URL-less categories")
+        return active
+    
+    def update_stats(self, counts):
+        """Merge a batch of counter deltas into self.stats"""
+        with self._stats_lock:
+            self.stats.update(counts)
+    
+    def install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to _request_shutdown on the running loop"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown)
+            except NotImplementedError:
+                # Windows event loops lack add_signal_handler
+                signal.signal(sig, self.signal_handler)
+    
     def signal_handler(self, signum, frame):
-        """Handle shutdown signals"""
-        self.logger.info("Shutdown requested, finishing current tasks...")
+        """Handle shutdown signals where the loop cannot"""
+        self._request_shutdown()
+    
+    def _request_shutdown(self):
+        """Stop scheduling new work and cancel in-flight downloads"""
+        self.logger.info("Shutdown requested, cancelling in-flight downloads...")
         self.shutdown_requested = True
+        for task in self._download_tasks:
+            task.cancel()
     
     async def run_discovery_phase(self):
         """Phase 1: Discover and scrape metadata"""
@@ -1147,13 +1413,9 @@ class EnhancedAXIOMScraper:
         self.logger.info("PHASE 1: DISCOVERY - Scraping metadata")
         self.logger.info("=" * 70)
         
-        categories = []
-        if 'primary_skin_categories' in self.config:
-            categories.extend(self.config['primary_skin_categories'])
-        if 'additional_categories' in self.config:
-            categories.extend(self.config['additional_categories'])
+        categories = self._active_categories
         
-        await self.scraper.init_session()
+        await self.scraper.init_session(self.connector)
         
         try:
             for idx, category in enumerate(categories, 1):
@@ -1162,8 +1424,7 @@ class EnhancedAXIOMScraper:
                 
                 self.logger.info(f"Category {idx}/{len(categories)}: {category.get('name')}")
                 skins_found = await self.scraper.scrape_category(category, self.db)
-                self.stats['skins_discovered'] += skins_found
-                self.stats['categories_processed'] += 1
+                self.update_stats({'skins_discovered': skins_found, 'categories_processed': 1})
         
         finally:
             await self.scraper.close_session()
@@ -1176,64 +1437,84 @@ class EnhancedAXIOMScraper:
         self.logger.info("PHASE 2: DOWNLOAD - Fetching skin packages")
         self.logger.info("=" * 70)
         
-        await self.downloader.init_session()
+        await self.downloader.init_session(self.connector)
+        loop = asyncio.get_running_loop()
+        
+        if self._seen_urls is None:
+            self._seen_urls = self.db.get_urls_with_status(self.TERMINAL_STATUSES)
         
         try:
             batch_num = 0
             while not self.shutdown_requested:
                 pending = self.db.get_pending_downloads(limit=self.batch_size)
+                pending = [s for s in pending if s.url not in self._seen_urls]
                 if not pending:
                     break
                 
                 batch_num += 1
                 self.logger.info(f"Batch {batch_num}: {len(pending)} skins")
                 
+                batch_rows = []
                 validated_skins = []
                 for skin in pending:
+                    if self.shutdown_requested:
+                        break
                     if await self.downloader.validate_download_url(skin.download_url):
                         validated_skins.append(skin)
                     else:
-                        self.db.update_download_status(skin.url, 'invalid_url')
+                        batch_rows.append((skin.url, 'invalid_url', {}))
+                
+                # A signal during validation cancels nothing yet; don't start
+                # downloads for it, leave the validated skins pending for resume
+                if self.shutdown_requested:
+                    validated_skins = []
                 
                 tasks = []
                 for skin in validated_skins:
-                    task = self.download_skin(skin)
+                    task = asyncio.create_task(self.download_skin(skin))
+                    self._download_tasks.add(task)
+                    task.add_done_callback(self._download_tasks.discard)
                     tasks.append(task)
                 
                 results = await asyncio.gather(*tasks, return_exceptions=True)
                 
+                batch_stats = Counter()
                 for skin, result in zip(validated_skins, results):
+                    if isinstance(result, asyncio.CancelledError):
+                        # Interrupted by shutdown; leave pending for resume
+                        continue
                     if isinstance(result, Exception):
                         self.logger.error(f"Download error for {skin.title}: {result}")
-                        self.db.update_download_status(skin.url, 'download_failed')
-                        self.stats['download_failures'] += 1
+                        result = (skin.url, 'download_failed', {})
+                    batch_rows.append(result)
+                    if result[1] == 'downloaded':
+                        batch_stats['skins_downloaded'] += 1
+                    else:
+                        batch_stats['download_failures'] += 1
+                
+                await loop.run_in_executor(
+                    self._db_executor, self.db.update_download_status_many, batch_rows
+                )
+                self._seen_urls.update(row[0] for row in batch_rows)
+                self.update_stats(batch_stats)
         
         finally:
             await self.downloader.close_session()
         
         self.logger.info(f"Downloads complete: {self.stats['skins_downloaded']} successful")
     
-    async def download_skin(self, skin):
-        """Download single skin"""
+    async def download_skin(self, skin) -> Tuple[str, str, Dict]:
+        """Download single skin, returning its (url, status, fields) DB update"""
         success, local_path, file_hash = await self.downloader.download_file(
             skin.download_url, skin.category, skin.title
         )
         
         if success:
-            self.db.update_download_status(
-                skin.url, 'downloaded',
-                local_path=local_path,
-                file_hash=file_hash
-            )
-            self.stats['skins_downloaded'] += 1
-            return True
-        else:
-            self.db.update_download_status(skin.url, 'download_failed')
-            self.stats['download_failures'] += 1
-            return False
+            return skin.url, 'downloaded', {'local_path': local_path, 'file_hash': file_hash}
+        return skin.url, 'download_failed', {}
     
     def run_extraction_phase(self):
-        """Phase 3: Extract archives"""
+        """Phase 3: Extract archives (blocking; run() calls it on the DB executor)"""
         self.logger.info("=" * 70)
         self.logger.info("PHASE 3: EXTRACTION - Unpacking archives")
         self.logger.info("=" * 70)
@@ -1243,50 +1524,61 @@ class EnhancedAXIOMScraper:
                 "SELECT * FROM skins WHERE download_status = 'downloaded'"
             )
             skins = [dict(row) for row in cursor.fetchall()]
-        
-        for skin_data in skins:
+
+        # Dispatch table keyed by lowercase archive suffix
+        extractors = {
+            '.zip': self.extractor.extract_zip,
+            '.rmskin': self.extractor.extract_zip,
+            '.rar': self.extractor.extract_rar,
+            '.7z': self.extractor.extract_7z,
+        }
+
+        batch_rows = []
+        batch_stats = Counter()
+        for idx, skin_data in enumerate(skins, 1):
             if self.shutdown_requested:
                 break
-            
+
             skin = SkinMetadata(**skin_data)
-            
-            if not skin.local_path or not Path(skin.local_path).exists():
+
+            # Single Path construction and a single stat() per skin
+            archive_path = Path(skin.local_path) if skin.local_path else None
+            if archive_path is None or not archive_path.is_file():
+                batch_rows.append((skin.url, 'missing_file', {}))
                 continue
-            
-            archive_path = Path(skin.local_path)
+
             file_ext = archive_path.suffix.lower()
-            
+
             success = False
             extract_path = ""
-            
+
             category_dir = self.extracted_dir / self.sanitize_filename(skin.category)
             skin_dir = category_dir / self.sanitize_filename(skin.title)
-            
-            if file_ext in ['.zip', '.rmskin']:
-                success, extract_path = self.extractor.extract_zip(archive_path, skin_dir)
-            elif file_ext == '.rar':
-                success, extract_path = self.extractor.extract_rar(archive_path, skin_dir)
-            elif file_ext == '.7z':
-                success, extract_path = self.extractor.extract_7z(archive_path, skin_dir)
-            
+
+            extract = extractors.get(file_ext)
+            if extract:
+                success, extract_path = extract(archive_path, skin_dir)
+
             if success:
-                self.db.update_download_status(
-                    skin.url, 'extracted',
-                    extracted_path=extract_path
-                )
-                self.stats['skins_extracted'] += 1
+                batch_rows.append((skin.url, 'extracted', {'extracted_path': extract_path}))
+                batch_stats['skins_extracted'] += 1
             else:
-                self.db.update_download_status(skin.url, 'extraction_failed')
-                self.stats['extraction_failures'] += 1
+                batch_rows.append((skin.url, 'extraction_failed', {}))
+                batch_stats['extraction_failures'] += 1
+            
+            if idx % self.batch_size == 0:
+                self.db.update_download_status_many(batch_rows)
+                self.update_stats(batch_stats)
+                batch_rows.clear()
+                batch_stats.clear()
         
+        self.db.update_download_status_many(batch_rows)
+        self.update_stats(batch_stats)
         self.logger.info(f"Extraction complete: {self.stats['skins_extracted']} skins extracted")
     
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        return filename[:100].strip('. ')
+        return filename.translate(_FILENAME_TRANSLATION)[:100].strip('. ')
     
     def save_final_reports(self):
         """Save final reports"""
@@ -1320,16 +1612,30 @@ class EnhancedAXIOMScraper:
         branding = AXIOMBranding()
         branding.show_startup_sequence()
         
+        self.install_signal_handlers()
+        
+        self.connector = aiohttp.TCPConnector(
+            limit=self.max_workers * 2,
+            limit_per_host=self.max_workers,
+            ttl_dns_cache=600,
+            keepalive_timeout=30
+        )
+        
         try:
-            await self.run_discovery_phase()
+            async with self.connector:
+                await self.run_discovery_phase()
+                
+                if not self.shutdown_requested:
+                    await self.run_download_phase()
             
-            if not self.shutdown_requested:
-                await self.run_download_phase()
+            loop = asyncio.get_running_loop()
             
+            # Extraction is blocking (archive I/O and SQLite flushes), so run it
+            # on the DB executor; the loop stays free to run signal handlers
             if not self.shutdown_requested:
-                self.run_extraction_phase()
+                await loop.run_in_executor(self._db_executor, self.run_extraction_phase)
             
-            self.save_final_reports()
+            await loop.run_in_executor(self._db_executor, self.save_final_reports)
             
             self.logger.info("=" * 70)
             self.logger.info("🎉 AXIOM SCRAPING COMPLETE! 🎉")
@@ -1338,6 +1644,9 @@ class EnhancedAXIOMScraper:
         except Exception as e:
             self.logger.error(f"Fatal error: {e}", exc_info=True)
             raise
+        
+        finally:
+            self._db_executor.shutdown(wait=True)
 
 
 # ============================================================================
@@ -6,33 +6,96 @@ Comprehensive tests for enhanced scraper functionality
 
 import pytest
 import asyncio
-import tempfile
 import shutil
 from pathlib import Path
 import json
+import os
 import sqlite3
+import sys
+import time
+import hashlib
+import logging
+import zipfile
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, AsyncMock
 import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from hypothesis import given, settings, strategies as st
+    HYPOTHESIS_AVAILABLE = True
+except ImportError:
+    HYPOTHESIS_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    from AXIOM import (
+        SkinDatabase, SkinMetadata, AdaptiveRateLimiter, SecureExtractor,
+        MetadataExtractor, AsyncDownloader, EnhancedAXIOMScraper,
+        _apply_success, _apply_success_py, NUMBA_AVAILABLE
+    )
+    from axiom_utilities import AXIOMUtilities, _walk_parallel
+except ImportError as e:
+    pytest.skip(f"AXIOM not importable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Fresh database path for tests that need isolation"""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def memory_db():
+    """Private in-memory database for tests that don't need the disk"""
+    db = SkinDatabase(f"file:axiom_{uuid.uuid4().hex}?mode=memory&cache=shared", uri=True)
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def seeded_db(tmp_path_factory):
+    """Database seeded once with 10000 skins for read-only query tests"""
+    db = SkinDatabase(tmp_path_factory.mktemp("axiom") / "test.db", fast_mode=True)
+    db.save_skins_many(
+        SkinMetadata(
+            url=f"https://example.com/skin{i}",
+            title=f"Skin {i}",
+            category=f"Category {i % 10}",
+            category_url="https://example.com/cat",
+            download_url=f"https://example.com/dl{i}",
+            download_status="pending" if i % 2 == 0 else "downloaded"
+        )
+        for i in range(10000)
+    )
+    return db
+
+
+def discard_tree(path: Path):
+    """Rename a bulky directory aside and delete it on a background thread"""
+    trash = path.with_name(path.name + ".trash")
+    path.rename(trash)
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True
+    ).start()
 
 
 class TestSkinDatabase:
     """Test database operations"""
     
-    def setup_method(self):
-        """Setup test database"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test.db"
-    
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_database_creation(self):
+    def test_database_creation(self, db_path):
         """Test database initialization"""
-        from AXIOM import SkinDatabase
-        
-        db = SkinDatabase(self.db_path)
-        assert self.db_path.exists()
+        db = SkinDatabase(db_path)
+        assert db_path.exists()
         
         # Verify tables exist
         with db.get_connection() as conn:
@@ -41,12 +104,15 @@ class TestSkinDatabase:
             )
             tables = [row[0] for row in cursor.fetchall()]
             assert 'skins' in tables
+            
+            indexes = {
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+            assert {'idx_status', 'idx_category', 'idx_author', 'idx_scraped_at'} <= indexes
     
-    def test_save_and_retrieve_skin(self):
+    def test_save_and_retrieve_skin(self, memory_db):
         """Test saving and retrieving skin metadata"""
-        from AXIOM import SkinDatabase, SkinMetadata
-        
-        db = SkinDatabase(self.db_path)
+        db = memory_db
         
         skin = SkinMetadata(
             url="https://example.com/skin1",
@@ -66,11 +132,9 @@ class TestSkinDatabase:
         assert retrieved.title == "Test Skin"
         assert retrieved.author == "Test Author"
     
-    def test_update_download_status(self):
+    def test_update_download_status(self, memory_db):
         """Test status updates"""
-        from AXIOM import SkinDatabase, SkinMetadata
-        
-        db = SkinDatabase(self.db_path)
+        db = memory_db
         
         skin = SkinMetadata(
             url="https://example.com/skin1",
@@ -94,12 +158,20 @@ class TestSkinDatabase:
         assert updated.download_status == 'downloaded'
         assert updated.local_path == '/path/to/file.zip'
         assert updated.file_hash == 'abc123'
+        
+        # Fields not passed keep their stored values
+        db.update_download_status(skin.url, 'extracted', extracted_path='/path/to/out')
+        updated = db.get_skin(skin.url)
+        assert updated.download_status == 'extracted'
+        assert updated.local_path == '/path/to/file.zip'
+        assert updated.extracted_path == '/path/to/out'
+        
+        with pytest.raises(TypeError):
+            db.update_download_status(skin.url, 'pending', title='injected')
     
-    def test_get_pending_downloads(self):
+    def test_get_pending_downloads(self, memory_db):
         """Test fetching pending downloads"""
-        from AXIOM import SkinDatabase, SkinMetadata
-        
-        db = SkinDatabase(self.db_path)
+        db = memory_db
         
         # Add test skins
         for i in range(10):
@@ -117,11 +189,9 @@ class TestSkinDatabase:
         assert len(pending) == 5
         assert all(s.download_status == 'pending' for s in pending)
     
-    def test_statistics(self):
+    def test_statistics(self, memory_db):
         """Test statistics generation"""
-        from AXIOM import SkinDatabase, SkinMetadata
-        
-        db = SkinDatabase(self.db_path)
+        db = memory_db
         
         # Add skins with different statuses
         statuses = ['pending', 'downloaded', 'extracted', 'failed']
@@ -146,29 +216,47 @@ class TestAdaptiveRateLimiter:
     @pytest.mark.asyncio
     async def test_initial_delay(self):
         """Test initial delay"""
-        from AXIOM import AdaptiveRateLimiter
-        
         limiter = AdaptiveRateLimiter(initial_delay=1.0)
         assert limiter.delay == 1.0
     
     @pytest.mark.asyncio
     async def test_success_speedup(self):
         """Test speedup after successes"""
-        from AXIOM import AdaptiveRateLimiter
-        
         limiter = AdaptiveRateLimiter(initial_delay=2.0, min_delay=0.5)
         
         # Trigger many successes
-        for _ in range(15):
-            limiter.on_success()
+        limiter.on_success_batch(15)
         
         assert limiter.delay < 2.0
         assert limiter.delay >= 0.5
     
+    def test_success_batch_matches_loop(self):
+        """Test batched successes match repeated on_success calls"""
+        looped = AdaptiveRateLimiter(initial_delay=2.0, min_delay=0.5)
+        batched = AdaptiveRateLimiter(initial_delay=2.0, min_delay=0.5)
+        
+        for n in (3, 15, 40, 200):
+            for _ in range(n):
+                looped.on_success()
+            batched.on_success_batch(n)
+            
+            assert batched.delay == pytest.approx(looped.delay)
+            assert batched.success_count == looped.success_count
+    
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_success_math_matches_reference(self):
+        """Test the (possibly JIT-compiled) success math matches pure Python"""
+        for delay in (0.5, 1.0, 2.0, 9.75):
+            for count in range(11):
+                for n in (1, 7, 11, 250):
+                    args = (delay, 0.5, count, n, 10, 0.95)
+                    fast_delay, fast_count = _apply_success(*args)
+                    ref_delay, ref_count = _apply_success_py(*args)
+                    assert abs(fast_delay - ref_delay) <= 1e-12
+                    assert fast_count == ref_count
+    
     def test_rate_limit_backoff(self):
         """Test backoff on rate limit"""
-        from AXIOM import AdaptiveRateLimiter
-        
         limiter = AdaptiveRateLimiter(initial_delay=1.0, max_delay=10.0)
         initial = limiter.delay
         
@@ -178,8 +266,6 @@ class TestAdaptiveRateLimiter:
     
     def test_error_handling(self):
         """Test error backoff"""
-        from AXIOM import AdaptiveRateLimiter
-        
         limiter = AdaptiveRateLimiter(initial_delay=1.0)
         
         # Multiple errors
@@ -192,21 +278,15 @@ class TestAdaptiveRateLimiter:
 class TestSecureExtractor:
     """Test secure extraction"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.extract_dir = Path(self.temp_dir) / "extract"
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
+        """Setup test environment (pytest prunes old tmp_path trees itself)"""
+        self.temp_dir = tmp_path
+        self.extract_dir = tmp_path / "extract"
         self.extract_dir.mkdir()
     
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
-    
     def test_path_traversal_detection(self):
         """Test path traversal protection"""
-        from AXIOM import SecureExtractor
-        import logging
-        
         logger = logging.getLogger("test")
         extractor = SecureExtractor(logger)
         
@@ -220,11 +300,9 @@ class TestSecureExtractor:
         unsafe = Path("/etc/passwd")
         assert not extractor.is_safe_path(base, unsafe)
     
-    def test_create_test_zip(self):
+    def create_test_zip(self):
         """Helper to create test zip"""
-        import zipfile
-        
-        zip_path = Path(self.temp_dir) / "test.zip"
+        zip_path = self.temp_dir / "test.zip"
         
         with zipfile.ZipFile(zip_path, 'w') as zf:
             zf.writestr("file1.txt", "content1")
@@ -232,11 +310,52 @@ class TestSecureExtractor:
         
         return zip_path
     
+    def test_zip_member_names_normalized(self):
+        """Member names get the same cleanup ZipFile.extract() applies"""
+        logger = logging.getLogger("test")
+        extractor = SecureExtractor(logger)
+        
+        # Windows rules: drive letters, illegal characters, trailing dots
+        assert extractor.member_path("C:/skins/a:b?.ini", '\\') == "skins\\a_b_.ini"
+        assert extractor.member_path("dir./file.txt.", '\\') == "dir\\file.txt"
+        assert extractor.member_path("a//./b.txt", '/') == "a/b.txt"
+        
+        zip_path = self.temp_dir / "odd.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("a//b.txt", "b")
+            zf.writestr("./c.txt", "c")
+        
+        success, _ = extractor.extract_zip(zip_path, self.extract_dir)
+        assert success
+        assert (self.extract_dir / "a" / "b.txt").read_text() == "b"
+        assert (self.extract_dir / "c.txt").read_text() == "c"
+    
+    def test_zip_member_traversal_neutralized(self):
+        """Parent references, roots and drive letters can't leave the target"""
+        logger = logging.getLogger("test")
+        extractor = SecureExtractor(logger)
+        
+        assert extractor.member_path("..\\..\\evil.txt", '\\') == "evil.txt"
+        assert extractor.member_path("C:\\Windows\\evil.dll", '\\') == "Windows\\evil.dll"
+        assert extractor.member_path("\\\\server\\share\\evil.txt", '\\') == "evil.txt"
+        assert extractor.member_path("a/../../evil.txt", '\\') == "a\\evil.txt"
+        assert extractor.member_path("../../evil.txt", '/') == "evil.txt"
+        assert extractor.member_path("/etc/evil.txt", '/') == "etc/evil.txt"
+        
+        zip_path = self.temp_dir / "traversal.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("..\\evil.txt", "x")
+            zf.writestr("C:\\evil.txt", "x")
+        
+        target = self.temp_dir / "nested" / "out"
+        success, _ = extractor.extract_zip(zip_path, target)
+        assert success
+        for path in self.temp_dir.rglob("*"):
+            if path.is_file() and path.suffix == ".txt":
+                assert target in path.parents
+    
     def test_zip_extraction(self):
         """Test ZIP extraction"""
-        from AXIOM import SecureExtractor
-        import logging
-        
         logger = logging.getLogger("test")
         extractor = SecureExtractor(logger)
         
@@ -249,6 +368,28 @@ class TestSecureExtractor:
         assert success
         assert (self.extract_dir / "file1.txt").exists()
         assert (self.extract_dir / "dir" / "file2.txt").exists()
+        
+        # Large stored archive exercises the buffered copy path
+        bench_dir = self.temp_dir / "bench"
+        bench_dir.mkdir()
+        big_zip = bench_dir / "big.zip"
+        block = b'\xab' * (1 << 20)
+        with zipfile.ZipFile(big_zip, 'w', compression=zipfile.ZIP_STORED) as zf:
+            with zf.open("big.bin", 'w') as f:
+                for _ in range(50):  # 50MB
+                    f.write(block)
+        
+        big_dir = bench_dir / "big"
+        start_time = time.time()
+        success, _ = extractor.extract_zip(big_zip, big_dir)
+        elapsed = time.time() - start_time
+        
+        assert success
+        assert (big_dir / "big.bin").stat().st_size == 50 * (1 << 20)
+        assert elapsed < 5.0
+        
+        # 100MB of fixtures shouldn't linger in the retained tmp_path trees
+        discard_tree(bench_dir)
 
 
 class TestMetadataExtractor:
@@ -256,10 +397,6 @@ class TestMetadataExtractor:
     
     def test_extract_title(self):
         """Test title extraction"""
-        from bs4 import BeautifulSoup
-        from AXIOM import MetadataExtractor
-        import logging
-        
         html = """
         <html>
             <head><title>Page Title</title></head>
@@ -269,7 +406,7 @@ class TestMetadataExtractor:
         </html>
         """
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         logger = logging.getLogger("test")
         extractor = MetadataExtractor(logger)
         
@@ -278,10 +415,6 @@ class TestMetadataExtractor:
     
     def test_extract_download_url(self):
         """Test download URL extraction"""
-        from bs4 import BeautifulSoup
-        from AXIOM import MetadataExtractor
-        import logging
-        
         html = """
         <html>
             <body>
@@ -290,7 +423,7 @@ class TestMetadataExtractor:
         </html>
         """
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         logger = logging.getLogger("test")
         extractor = MetadataExtractor(logger)
         
@@ -299,9 +432,6 @@ class TestMetadataExtractor:
     
     def test_validate_download_url(self):
         """Test download URL validation"""
-        from AXIOM import MetadataExtractor
-        import logging
-        
         logger = logging.getLogger("test")
         extractor = MetadataExtractor(logger)
         
@@ -313,26 +443,48 @@ class TestMetadataExtractor:
         # Invalid URLs
         assert not extractor.is_valid_download_url("")
         assert not extractor.is_valid_download_url("https://example.com/page.html")
+    
+    @pytest.mark.skipif(not HYPOTHESIS_AVAILABLE, reason="hypothesis not installed")
+    def test_validate_download_url_property(self):
+        """Validator returns a bool quickly for arbitrary and oversized URLs"""
+        logger = logging.getLogger("test")
+        extractor = MetadataExtractor(logger)
+        
+        # URL-shaped strings, the same with huge query strings, and arbitrary text
+        # (hand-built: hypothesis.provisional.urls() is ~5x slower to generate)
+        urls = st.builds(
+            lambda scheme, path, suffix: f"{scheme}://example.com/{path}{suffix}",
+            st.sampled_from(['http', 'https', 'ftp']),
+            st.text(),
+            st.sampled_from(['', '.zip', '.rmskin', '.html', '/download'])
+        )
+        inputs = st.one_of(
+            urls,
+            st.builds(lambda u, n: f"{u}?{'q=download&' * n}", urls, st.integers(1000, 100000)),
+            st.text()
+        )
+        
+        # The deadline makes each example a micro-benchmark for slow paths
+        @settings(max_examples=2000, deadline=50)
+        @given(inputs)
+        def check(url):
+            assert isinstance(extractor.is_valid_download_url(url), bool)
+        
+        check()
 
 
 class TestAsyncDownloader:
     """Test async download functionality"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.download_dir = Path(self.temp_dir) / "downloads"
+        self.temp_dir = tmp_path
+        self.download_dir = tmp_path / "downloads"
         self.download_dir.mkdir()
     
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
-    
     def test_filename_extraction(self):
         """Test filename extraction from URL"""
-        from AXIOM import AsyncDownloader, AdaptiveRateLimiter
-        import logging
-        
         logger = logging.getLogger("test")
         limiter = AdaptiveRateLimiter()
         downloader = AsyncDownloader(self.download_dir, logger, limiter)
@@ -350,9 +502,6 @@ class TestAsyncDownloader:
     
     def test_sanitize_filename(self):
         """Test filename sanitization"""
-        from AXIOM import AsyncDownloader, AdaptiveRateLimiter
-        import logging
-        
         logger = logging.getLogger("test")
         limiter = AdaptiveRateLimiter()
         downloader = AsyncDownloader(self.download_dir, logger, limiter)
@@ -367,28 +516,111 @@ class TestAsyncDownloader:
         long_name = 'a' * 200
         result = downloader.sanitize_filename(long_name)
         assert len(result) <= 100
+    
+    @pytest.mark.asyncio
+    async def test_download_many_concurrent(self):
+        """Test many downloads share one session under a bounded semaphore"""
+        payload = b'PK' + b'\0' * 1024
+        in_flight = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return web.Response(body=payload, content_type='application/zip')
+        
+        app = web.Application()
+        app.router.add_get('/files/{name}', handler)
+        server = TestServer(app)
+        await server.start_server()
+        
+        try:
+            logger = logging.getLogger("test")
+            limiter = AdaptiveRateLimiter(initial_delay=0, min_delay=0)
+            downloader = AsyncDownloader(self.download_dir, logger, limiter)
+            connector = aiohttp.TCPConnector(limit_per_host=64)
+            await downloader.init_session(connector)
+            
+            items = [
+                (str(server.make_url(f'/files/skin{i}.zip')), 'Test', f'Skin {i}')
+                for i in range(200)
+            ]
+            try:
+                results = await downloader.download_many(items, concurrency=64)
+            finally:
+                await downloader.close_session()
+                await connector.close()
+        finally:
+            await server.close()
+        
+        assert len(results) == 200
+        assert all(success for success, _, _ in results)
+        assert len(list((self.download_dir / 'Test').iterdir())) == 200
+        assert 1 < peak <= 64
+    
+    @pytest.mark.asyncio
+    async def test_download_writes_off_event_loop(self):
+        """Test file writes go through the thread pool, not the event loop"""
+        payload = b'PK' + b'\x01' * (256 * 1024)
+        
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+            
+            def submit(self, fn, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return super().submit(fn, *args, **kwargs)
+        
+        async def handler(request):
+            return web.Response(body=payload, content_type='application/zip')
+        
+        app = web.Application()
+        app.router.add_get('/skin.zip', handler)
+        server = TestServer(app)
+        await server.start_server()
+        
+        loop = asyncio.get_running_loop()
+        executor = CountingExecutor(max_workers=2)
+        loop.set_default_executor(executor)
+        
+        try:
+            logger = logging.getLogger("test")
+            limiter = AdaptiveRateLimiter(initial_delay=0, min_delay=0)
+            downloader = AsyncDownloader(self.download_dir, logger, limiter)
+            await downloader.init_session()
+            try:
+                success, local_path, file_hash = await downloader.download_file(
+                    str(server.make_url('/skin.zip')), 'Test', 'Skin'
+                )
+            finally:
+                await downloader.close_session()
+        finally:
+            await server.close()
+        
+        assert success
+        assert Path(local_path).read_bytes() == payload
+        assert file_hash == hashlib.sha256(payload).hexdigest()
+        # open + one write per chunk + close all hop through the executor
+        assert CountingExecutor.submitted >= 3
 
 
 class TestIntegration:
     """Integration tests"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_dir = Path(self.temp_dir) / "output"
+        self.temp_dir = tmp_path
+        self.output_dir = tmp_path / "output"
         self.output_dir.mkdir()
     
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
-    
     @pytest.mark.asyncio
     async def test_full_pipeline_mock(self):
         """Test complete pipeline with mocked network"""
-        from AXIOM import EnhancedAXIOMScraper
-        
         # Create mock config
-        config_file = Path(self.temp_dir) / "config.json"
+        config_file = self.temp_dir / "config.json"
         config = {
             "rainmeterui_categories": {
                 "primary_skin_categories": [
@@ -400,8 +632,10 @@ class TestIntegration:
             }
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(config, f)
+        if orjson is not None:
+            config_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            config_file.write_text(json.dumps(config, indent=2), encoding='utf-8')
         
         # This would require extensive mocking of aiohttp
         # For now, just test instantiation
@@ -416,26 +650,86 @@ class TestIntegration:
         assert scraper.db is not None
         assert scraper.rate_limiter is not None
         assert scraper.output_dir.exists()
+        assert scraper.config == config["rainmeterui_categories"]
+    
+    def make_scraper(self):
+        """Helper to build a scraper over a one-category config"""
+        config_file = self.temp_dir / "config.json"
+        config_file.write_text(json.dumps({
+            "primary_skin_categories": [{"name": "Test", "url": "https://example.com/test"}]
+        }), encoding='utf-8')
+        return EnhancedAXIOMScraper(
+            config_file=str(config_file),
+            output_dir=str(self.output_dir),
+            delay=0.0,
+            batch_size=10
+        )
+    
+    @pytest.mark.asyncio
+    async def test_signal_reaches_extraction_phase(self):
+        """A shutdown request made during extraction is handled while the phase runs"""
+        scraper = self.make_scraper()
+        scraper.run_discovery_phase = AsyncMock()
+        scraper.run_download_phase = AsyncMock()
+        scraper.save_final_reports = Mock()
+        scraper.install_signal_handlers = Mock()
+        
+        loop = asyncio.get_running_loop()
+        main_thread = threading.get_ident()
+        handled_during_phase = []
+        
+        def extraction():
+            # Blocks like a real extraction until the shutdown flag flips.
+            # Loop signal handlers are dispatched through call_soon the same way.
+            assert threading.get_ident() != main_thread
+            loop.call_soon_threadsafe(scraper._request_shutdown)
+            deadline = time.time() + 5
+            while not scraper.shutdown_requested and time.time() < deadline:
+                time.sleep(0.01)
+            handled_during_phase.append(scraper.shutdown_requested)
+        
+        scraper.run_extraction_phase = extraction
+        with patch('AXIOM.AXIOMBranding'):
+            await scraper.run()
+        
+        assert handled_during_phase == [True]
+    
+    @pytest.mark.asyncio
+    async def test_shutdown_during_validation_starts_no_downloads(self):
+        """Shutdown while validating URLs leaves the batch pending"""
+        scraper = self.make_scraper()
+        scraper.db.save_skins_many(
+            SkinMetadata(
+                url=f"https://example.com/skin{i}",
+                title=f"Skin {i}",
+                category="Test",
+                category_url="https://example.com/cat",
+                download_url=f"https://example.com/dl{i}.zip"
+            )
+            for i in range(5)
+        )
+        
+        async def validate(url):
+            if url.endswith("dl1.zip"):
+                scraper._request_shutdown()
+            return True
+        
+        scraper.downloader.validate_download_url = validate
+        scraper.downloader.download_file = AsyncMock()
+        
+        await scraper.run_download_phase()
+        
+        scraper.downloader.download_file.assert_not_called()
+        assert scraper.db.get_statistics()['by_status'] == {'pending': 5}
 
 
 class TestErrorRecovery:
     """Test error recovery and resilience"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test.db"
-    
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_database_recovery_after_crash(self):
+    def test_database_recovery_after_crash(self, db_path):
         """Test database can recover after interruption"""
-        from AXIOM import SkinDatabase, SkinMetadata
-        
         # Create database and add data
-        db1 = SkinDatabase(self.db_path)
+        db1 = SkinDatabase(db_path)
         skin = SkinMetadata(
             url="https://example.com/skin1",
             title="Test Skin",
@@ -448,17 +742,15 @@ class TestErrorRecovery:
         del db1
         
         # Create new database instance
-        db2 = SkinDatabase(self.db_path)
+        db2 = SkinDatabase(db_path)
         retrieved = db2.get_skin(skin.url)
         
         assert retrieved is not None
         assert retrieved.title == "Test Skin"
     
-    def test_partial_download_handling(self):
+    def test_partial_download_handling(self, memory_db):
         """Test handling of interrupted downloads"""
-        from AXIOM import SkinDatabase, SkinMetadata
-        
-        db = SkinDatabase(self.db_path)
+        db = memory_db
         
         # Simulate partial download
         skin = SkinMetadata(
@@ -481,106 +773,83 @@ class TestErrorRecovery:
         assert retrieved.download_status == "pending"
 
 
+def make_test_skin(i: int) -> SkinMetadata:
+    """Build a skin in a worker process (module-level so the pool can pickle it)"""
+    return SkinMetadata(
+        url=f"https://example.com/skin{i}",
+        title=f"Skin {i}",
+        category="Test",
+        category_url="https://example.com/cat"
+    )
+
+
 class TestPerformance:
     """Performance tests"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test.db"
-    
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_bulk_insert_performance(self):
+    def test_bulk_insert_performance(self, db_path):
         """Test bulk insert performance"""
-        import time
-        from AXIOM import SkinDatabase, SkinMetadata
+        db = SkinDatabase(db_path, fast_mode=True)
         
-        db = SkinDatabase(self.db_path)
+        # Insert 1000 skins: worker processes generate, a single writer inserts,
+        # mirroring the scraper's many-fetchers-to-one-database fan-in
+        with multiprocessing.Pool(4) as pool:
+            skins = list(pool.imap_unordered(make_test_skin, range(1000), chunksize=100))
         
-        # Insert 1000 skins
+        # Only the insert is timed; pool startup re-imports AXIOM per worker
+        # under the spawn start method (Windows/macOS) and would dominate
         start_time = time.time()
-        
-        for i in range(1000):
-            skin = SkinMetadata(
-                url=f"https://example.com/skin{i}",
-                title=f"Skin {i}",
-                category="Test",
-                category_url="https://example.com/cat"
-            )
-            db.save_skin(skin)
-        
+        assert db.save_skins_many(skins)
         elapsed = time.time() - start_time
         
-        # Should complete in reasonable time (< 5 seconds)
-        assert elapsed < 5.0
+        # The single-writer insert should finish well under 2 seconds
+        assert elapsed < 2.0
         
         # Verify all inserted
         stats = db.get_statistics()
         assert stats['total_skins'] == 1000
     
-    def test_query_performance(self):
+    def test_query_performance(self, seeded_db):
         """Test query performance with large dataset"""
-        import time
-        from AXIOM import SkinDatabase, SkinMetadata
-        
-        db = SkinDatabase(self.db_path)
-        
-        # Insert 10000 skins
-        for i in range(10000):
-            skin = SkinMetadata(
-                url=f"https://example.com/skin{i}",
-                title=f"Skin {i}",
-                category=f"Category {i % 10}",
-                category_url="https://example.com/cat",
-                download_status="pending" if i % 2 == 0 else "downloaded"
-            )
-            db.save_skin(skin)
-        
         # Test query performance
         start_time = time.time()
-        pending = db.get_pending_downloads(limit=100)
+        pending = seeded_db.get_pending_downloads(limit=100)
         elapsed = time.time() - start_time
         
         # Should be fast (< 0.1 seconds)
         assert elapsed < 0.1
         assert len(pending) == 100
+        
+        # The pending query must be answered from an index, not a table scan
+        with seeded_db.get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN " + seeded_db._PENDING_SQL, (100,)
+            ).fetchall()
+        assert 'USING INDEX' in plan[0][3]
 
 
 class TestSecurityFeatures:
     """Test security features"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Cleanup"""
-        shutil.rmtree(self.temp_dir)
+        self.temp_dir = tmp_path
     
     def test_path_traversal_prevention(self):
         """Test path traversal attacks are prevented"""
-        from AXIOM import SecureExtractor
-        import logging
-        
         logger = logging.getLogger("test")
         extractor = SecureExtractor(logger)
         
-        base_path = Path(self.temp_dir) / "safe"
+        base_path = self.temp_dir / "safe"
         base_path.mkdir()
         
         # Attempt traversal
-        malicious_path = Path(self.temp_dir) / "safe" / ".." / ".." / "etc" / "passwd"
+        malicious_path = self.temp_dir / "safe" / ".." / ".." / "etc" / "passwd"
         
         assert not extractor.is_safe_path(base_path, malicious_path)
     
     def test_file_size_limits(self):
         """Test file size limits are enforced"""
-        from AXIOM import SecureExtractor
-        import logging
-        
         logger = logging.getLogger("test")
         extractor = SecureExtractor(logger)
         
@@ -591,46 +860,217 @@ class TestSecurityFeatures:
     
     def test_zip_bomb_protection(self):
         """Test protection against zip bombs"""
-        from AXIOM import SecureExtractor
-        import logging
-        import zipfile
-        
         logger = logging.getLogger("test")
         extractor = SecureExtractor(logger)
         
         # Create a zip with reported size > max
-        zip_path = Path(self.temp_dir) / "bomb.zip"
-        extract_dir = Path(self.temp_dir) / "extract"
+        zip_path = self.temp_dir / "bomb.zip"
+        extract_dir = self.temp_dir / "extract"
         extract_dir.mkdir()
         
-        # This is a simplified test - real zip bombs are more complex
-        with zipfile.ZipFile(zip_path, 'w') as zf:
-            # Write a file that claims to be huge
+        # ZIP_STORED copies the payload as-is instead of deflating it
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
             large_data = b'0' * (1024 * 1024)  # 1MB of data
             zf.writestr("small.txt", large_data)
         
-        # Should handle gracefully
+        # Under limits, so it should extract normally
         success, path = extractor.extract_zip(zip_path, extract_dir)
-        # In this case it should succeed since it's under limits
-        # Real zip bomb would trigger size check
+        assert success
+        
+        # Highly compressible payload streamed in 4KB chunks, never
+        # buffered whole in memory
+        bomb_path = self.temp_dir / "real_bomb.zip"
+        chunk = b'\0' * 4096
+        with zipfile.ZipFile(bomb_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=9) as zf:
+            with zf.open("bomb.bin", 'w', force_zip64=True) as f:
+                for _ in range(1024):  # 4MB uncompressed
+                    f.write(chunk)
+        
+        # Lower the archive limit so a small bomb trips the size check
+        extractor.MAX_EXTRACT_SIZE = 2 * 1024 * 1024
+        success, path = extractor.extract_zip(bomb_path, self.temp_dir / "bomb")
+        assert not success
+        assert not (self.temp_dir / "bomb").exists()
+
+
+class TestAXIOMUtilities:
+    """Test the maintenance commands against a scraper-written database"""
+    
+    @pytest.fixture(autouse=True)
+    def setup_db(self, tmp_path):
+        """Scraper database with a few skins, plus utilities over the same file"""
+        self.data_dir = tmp_path / "scraped_data"
+        self.data_dir.mkdir()
+        self.db = SkinDatabase(self.data_dir / "skins.db")
+        self.db.save_skins_many(
+            SkinMetadata(
+                url=f"https://example.com/skin{i}",
+                title=title,
+                category="Weather",
+                category_url="https://example.com/cat",
+                author="Someone"
+            )
+            for i, title in enumerate(("Weather Widget", "Clock Suite", "Feather Dock"))
+        )
+        self.utils = AXIOMUtilities(self.data_dir / "skins.db")
+        yield
+        self.db.close()
+    
+    def fts_titles(self, query):
+        """Titles the FTS index returns for a title query"""
+        conn = self.utils.get_connection()
+        rows = conn.execute(
+            "SELECT s.title FROM skins_fts JOIN skins s ON s.rowid = skins_fts.rowid "
+            "WHERE skins_fts MATCH ?",
+            (self.utils.fts_query(query, 'title'),)
+        ).fetchall()
+        # 'integrity-check' compares the index against the skins table itself
+        conn.execute("INSERT INTO skins_fts(skins_fts, rank) VALUES ('integrity-check', 1)")
+        self.utils.close_connection(conn)
+        return sorted(row['title'] for row in rows)
+    
+    def test_search_index_tracks_scraper_writes(self):
+        """FTS stays in sync with INSERT OR REPLACE re-saves and status updates"""
+        assert self.utils.ensure_search_index()
+        assert self.fts_titles("weather") == ["Weather Widget"]
+        
+        # Re-saving replaces the row; the old title must leave the index
+        self.db.save_skin(SkinMetadata(
+            url="https://example.com/skin0",
+            title="Rain Gauge",
+            category="Weather",
+            category_url="https://example.com/cat"
+        ))
+        assert self.fts_titles("weather") == []
+        assert self.fts_titles("rain") == ["Rain Gauge"]
+        
+        self.db.update_download_status(
+            "https://example.com/skin1", "downloaded", local_path="/tmp/clock.zip"
+        )
+        assert self.fts_titles("clock") == ["Clock Suite"]
+        
+        self.db.save_skin(SkinMetadata(
+            url="https://example.com/skin9",
+            title="Clock Mini",
+            category="Weather",
+            category_url="https://example.com/cat"
+        ))
+        assert self.fts_titles("clock") == ["Clock Mini", "Clock Suite"]
+    
+    def test_search_matches_word_prefixes_not_substrings(self, capsys):
+        """Full-text fields match whole words or prefixes; url keeps LIKE"""
+        self.utils.search("weath")
+        assert "Found 1 results" in capsys.readouterr().out
+        
+        # 'ather' is inside "Weather" and "Feather" but starts no word
+        self.utils.search("ather")
+        assert "No results found" in capsys.readouterr().out
+        
+        self.utils.search("skin2", field='url')
+        assert "Feather Dock" in capsys.readouterr().out
+    
+    @pytest.mark.parametrize("relative_db", [True, False], ids=["relative", "absolute"])
+    def test_cleanup_keeps_referenced_downloads(self, relative_db, monkeypatch):
+        """Only unreferenced files are offered, however local_path was recorded"""
+        monkeypatch.chdir(self.data_dir.parent)
+        category_dir = self.data_dir / "downloads" / "Weather"
+        category_dir.mkdir(parents=True)
+        for name in ("s0.zip", "s1.zip", "orphan.zip"):
+            (category_dir / name).write_bytes(b"zip")
+        
+        # The scraper records paths relative to its working directory
+        self.db.update_download_status(
+            "https://example.com/skin0", "downloaded",
+            local_path=os.path.join("scraped_data", "downloads", "Weather", "s0.zip")
+        )
+        self.db.update_download_status(
+            "https://example.com/skin1", "downloaded", local_path=str(category_dir / "s1.zip")
+        )
+        
+        db_path = Path("scraped_data", "skins.db") if relative_db else self.data_dir / "skins.db"
+        with patch('builtins.input', return_value='y'):
+            AXIOMUtilities(db_path).cleanup()
+        
+        assert sorted(path.name for path in category_dir.iterdir()) == ["s0.zip", "s1.zip"]
+    
+    def test_walk_skips_hidden_and_unreadable_dirs(self):
+        """The parallel walk finds nested files and survives a bad directory"""
+        root = self.data_dir / "downloads"
+        for relative in ("a.zip", "Cat/b.zip", "Cat/Sub/c.zip", ".cache/d.zip", "Locked/e.zip"):
+            (root / relative).parent.mkdir(parents=True, exist_ok=True)
+            (root / relative).write_bytes(b"zip")
+        
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if os.path.basename(path) == "Locked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+        
+        with patch('axiom_utilities.os.scandir', side_effect=scandir):
+            found = sorted(os.path.relpath(path, root) for path in _walk_parallel(str(root)))
+        
+        assert found == sorted(["a.zip", os.path.join("Cat", "b.zip"),
+                                os.path.join("Cat", "Sub", "c.zip")])
+    
+    def test_reset_only_counts_rows_it_changes(self, capsys):
+        """A repeated reset finds nothing left to rewrite"""
+        self.db.update_download_status(
+            "https://example.com/skin0", "download_failed", local_path="/tmp/s0.zip"
+        )
+        self.db.update_download_status("https://example.com/skin1", "download_failed")
+        # NULLs count as dirty; reset normalizes them to ''
+        with self.db.get_connection() as conn:
+            conn.execute("UPDATE skins SET file_hash = NULL WHERE url = 'https://example.com/skin2'")
+        
+        self.utils.reset(category="Weather")
+        assert "Reset 3 skins" in capsys.readouterr().out
+        self.utils.reset(category="Weather")
+        assert "Reset 0 skins" in capsys.readouterr().out
+        
+        assert self.db.get_statistics()['by_status'] == {'pending': 3}
+        with self.db.get_connection() as conn:
+            leftovers = conn.execute(
+                "SELECT COUNT(*) FROM skins WHERE local_path != '' OR file_hash IS NULL"
+            ).fetchone()[0]
+        assert leftovers == 0
+    
+    def test_failed_backup_leaves_no_temp_file(self):
+        """A backup that fails partway removes its .tmp copy"""
+        with patch.object(self.utils, 'get_connection') as get_connection:
+            get_connection.return_value.backup.side_effect = sqlite3.OperationalError("disk I/O error")
+            with pytest.raises(sqlite3.OperationalError):
+                self.utils.backup()
+        
+        assert list((self.data_dir / "backups").iterdir()) == []
 
 
 def run_all_tests():
     """Run all tests"""
-    import sys
-    
     print("=" * 70)
     print("AXIOM TEST SUITE")
     print("=" * 70)
     print()
     
-    # Run pytest
-    exit_code = pytest.main([
+    args = [
         __file__,
         '-v',
         '--tb=short',
         '--color=yes'
-    ])
+    ]
+    
+    # Spread test classes across cores when pytest-xdist is installed; the
+    # suite is one file, so grouping by scope keeps class-level setup together
+    # while different classes run on different workers
+    try:
+        import xdist  # noqa: F401
+        args += ['-n', 'auto', '--dist=loadscope']
+    except ImportError:
+        pass
+    
+    # Run pytest
+    exit_code = pytest.main(args)
     
     sys.exit(exit_code)
 
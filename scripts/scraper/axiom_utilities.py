@@ -5,17 +5,188 @@ Helper tools for managing AXIOM scraper
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 import json
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-import shutil
+
+# Fast JSON encoding (optional); both paths produce UTF-8 bytes, compact
+# unless pretty-printing is asked for
+try:
+    import orjson
+    
+    def _dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    # Encoders built once and reused for every row
+    _COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    _PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+    
+    def _dumps(obj, pretty=False):
+        encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+        return encoder.encode(obj).encode('utf-8')
+
+
+def _scan_dir(path):
+    """List one directory, returning (file paths, subdirectory paths)"""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # DirEntry types come from the directory read, so no extra stat.
+                # Symlinked dirs aren't followed (no cycles) and hidden dirs are
+                # pruned, as the scraper never writes into either.
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.'):
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does by default
+        pass
+    return files, subdirs
+
+
+def _walk_parallel(root, max_workers=8):
+    """Yield files under root, scanning directories concurrently"""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_scan_dir, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_files, subdirs = future.result()
+                pending.update(pool.submit(_scan_dir, d) for d in subdirs)
+                yield from dir_files
+
+
+def _unlink_missing_ok(path):
+    """os.unlink that ignores files already gone"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 class AXIOMUtilities:
     """Utility commands for AXIOM scraper"""
     
+    STATUS_ICONS = {
+        'pending': '⏳',
+        'downloaded': '📥',
+        'extracted': '✅',
+        'download_failed': '❌',
+        'extraction_failed': '⚠️'
+    }
+    
+    REQUIRED_FIELDS = ('url', 'title', 'category')
+    
+    # Every stats() section as one labelled UNION ALL; each branch is a
+    # subquery so it keeps its own ORDER BY/LIMIT
+    STATS_SQL = """
+        SELECT * FROM (
+            SELECT 'status' AS section, download_status AS label, COUNT(*) AS count, NULL AS detail
+            FROM skins GROUP BY download_status ORDER BY count DESC
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'category', category, COUNT(*) AS count, NULL
+            FROM skins GROUP BY category ORDER BY count DESC LIMIT 10
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'author', author, COUNT(*) AS count, NULL
+            FROM skins WHERE author != 'Unknown Author'
+            GROUP BY author ORDER BY count DESC LIMIT 10
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'recent', title, NULL, category
+            FROM skins ORDER BY scraped_at DESC LIMIT 5
+        )
+    """
+    
+    # Rows pulled from SQLite per fetch when streaming exports
+    EXPORT_BATCH_SIZE = 1000
+    
+    # Scan-friendly per-connection settings (same as the scraper's fast mode).
+    # journal_mode=WAL is persisted in the file header, so get_connection()
+    # only switches it on for writable connections.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+    )
+    
+    # Indexes backing stats() aggregations, search() ordering and cleanup(); the
+    # first four match the scraper's own schema and are no-ops when present
+    INDEXES = {
+        'idx_status': "CREATE INDEX IF NOT EXISTS idx_status ON skins(download_status)",
+        'idx_category': "CREATE INDEX IF NOT EXISTS idx_category ON skins(category)",
+        'idx_author': "CREATE INDEX IF NOT EXISTS idx_author ON skins(author)",
+        'idx_scraped_at': "CREATE INDEX IF NOT EXISTS idx_scraped_at ON skins(scraped_at DESC)",
+        'idx_title_nocase': "CREATE INDEX IF NOT EXISTS idx_title_nocase ON skins(title COLLATE NOCASE)",
+        'idx_local_path': "CREATE INDEX IF NOT EXISTS idx_local_path ON skins(local_path)",
+    }
+    STATS_INDEXES = ('idx_status', 'idx_category', 'idx_author', 'idx_scraped_at')
+    
+    # External-content FTS5 index over the searchable text columns, kept in
+    # sync by triggers. The scraper saves with INSERT OR REPLACE, whose
+    # implicit delete doesn't fire delete triggers, so the stale entry is
+    # dropped by a BEFORE INSERT trigger instead.
+    FTS_COLUMNS = ('title', 'author', 'category', 'description')
+    FTS_SCHEMA = (
+        """CREATE VIRTUAL TABLE IF NOT EXISTS skins_fts USING fts5(
+            title, author, category, description,
+            content='skins', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS skins_fts_bi BEFORE INSERT ON skins BEGIN
+            INSERT INTO skins_fts(skins_fts, rowid, title, author, category, description)
+            SELECT 'delete', rowid, title, author, category, description
+            FROM skins WHERE url = new.url;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS skins_fts_ai AFTER INSERT ON skins BEGIN
+            INSERT INTO skins_fts(rowid, title, author, category, description)
+            VALUES (new.rowid, new.title, new.author, new.category, new.description);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS skins_fts_ad AFTER DELETE ON skins BEGIN
+            INSERT INTO skins_fts(skins_fts, rowid, title, author, category, description)
+            VALUES ('delete', old.rowid, old.title, old.author, old.category, old.description);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS skins_fts_au
+        AFTER UPDATE OF title, author, category, description ON skins BEGIN
+            INSERT INTO skins_fts(skins_fts, rowid, title, author, category, description)
+            VALUES ('delete', old.rowid, old.title, old.author, old.category, old.description);
+            INSERT INTO skins_fts(rowid, title, author, category, description)
+            VALUES (new.rowid, new.title, new.author, new.category, new.description);
+        END""",
+    )
+    
+    # Appended to reset() UPDATEs so rows that are already clean aren't
+    # rewritten (IS NOT also catches NULLs, which reset normalizes to '')
+    RESET_NEEDED = """
+                AND (download_status IS NOT 'pending' 
+                     OR local_path IS NOT '' 
+                     OR extracted_path IS NOT '' 
+                     OR file_hash IS NOT '')
+    """
+    
+    # Fixed statement text per searchable field: no SQL built from input,
+    # and each text hits sqlite3's statement cache on reuse
+    LIKE_SEARCH_SQL = {
+        field: f"""
+            SELECT title, author, category, download_status, url 
+            FROM skins 
+            WHERE {field} LIKE ? 
+            ORDER BY title COLLATE NOCASE
+        """
+        for field in ('title', 'author', 'category', 'description', 'url')
+    }
+    
     def __init__(self, db_path='scraped_data/skins.db'):
         self.db_path = Path(db_path)
         if not self.db_path.exists():
@@ -23,119 +194,174 @@ class AXIOMUtilities:
             print("Run the scraper first to create the database")
             sys.exit(1)
     
-    def get_connection(self):
+    def ensure_indexes(self, *names):
+        """Create the named query indexes (all of INDEXES by default) if missing
+        
+        Only opens a writable connection when something is actually missing,
+        so databases that already have them are left untouched.
+        """
+        names = names or tuple(self.INDEXES)
+        conn = self.get_connection(read_only=True)
+        existing = {
+            row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        self.close_connection(conn)
+        
+        missing = [self.INDEXES[name] for name in names if name not in existing]
+        if not missing:
+            return
+        
+        conn = self.get_connection()
+        with conn:
+            for statement in missing:
+                conn.execute(statement)
+        self.close_connection(conn)
+    
+    def ensure_search_index(self):
+        """Create and populate the FTS5 search index; False if FTS5 is unavailable"""
+        conn = self.get_connection()
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'skins_fts'"
+            ).fetchone()
+            with conn:
+                for statement in self.FTS_SCHEMA:
+                    conn.execute(statement)
+                if not exists:
+                    conn.execute("INSERT INTO skins_fts(skins_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search() falls back to LIKE
+            return False
+        finally:
+            self.close_connection(conn)
+    
+    @staticmethod
+    def fts_query(query, field):
+        """Turn free text into an FTS5 prefix query restricted to one column
+        
+        Every token is quoted so FTS5 operators typed by the user ('-', '"',
+        '*', AND/OR/NOT) are matched literally.
+        """
+        tokens = query.split()
+        if not tokens:
+            return None
+        terms = ' '.join('"' + token.replace('"', '""') + '"*' for token in tokens)
+        return f"{field} : ({terms})"
+    
+    def get_connection(self, read_only=False):
         """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
         conn.row_factory = sqlite3.Row
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
         return conn
     
+    def close_connection(self, conn):
+        """Close a connection, first letting SQLite refresh planner statistics
+        
+        Only read-write connections are optimized; PRAGMA optimize may run
+        ANALYZE, and read-only commands must not write to the database. It is
+        also skipped inside an open transaction, which closing rolls back.
+        """
+        if not conn.in_transaction and not conn.execute("PRAGMA query_only").fetchone()[0]:
+            conn.execute("PRAGMA optimize")
+        conn.close()
+    
     def stats(self):
         """Show detailed statistics"""
-        print("\n" + "=" * 70)
-        print("AXIOM COLLECTION STATISTICS")
-        print("=" * 70 + "\n")
-        
-        conn = self.get_connection()
-        
-        # Total skins
-        cursor = conn.execute("SELECT COUNT(*) FROM skins")
-        total = cursor.fetchone()[0]
-        print(f"📊 Total Skins: {total}")
-        print()
-        
-        # By status
-        print("Status Breakdown:")
-        cursor = conn.execute("""
-            SELECT download_status, COUNT(*) as count 
-            FROM skins 
-            GROUP BY download_status 
-            ORDER BY count DESC
-        """)
-        for row in cursor:
+        # Databases from older scrapers may predate idx_author/idx_scraped_at
+        self.ensure_indexes(*self.STATS_INDEXES)
+        conn = self.get_connection(read_only=True)
+        
+        # All sections in one round trip; the total is summed from the status rows
+        sections = {section: [] for section in ('status', 'category', 'author', 'recent')}
+        for row in conn.execute(self.STATS_SQL):
+            sections[row['section']].append(row)
+        self.close_connection(conn)
+        
+        total = sum(row['count'] for row in sections['status'])
+        
+        # Collect the whole report and write it once instead of printing per row
+        out = [
+            "",
+            "=" * 70,
+            "AXIOM COLLECTION STATISTICS",
+            "=" * 70,
+            "",
+            f"📊 Total Skins: {total}",
+            "",
+            "Status Breakdown:",
+        ]
+        for row in sections['status']:
             percentage = (row['count'] / total * 100) if total > 0 else 0
-            print(f"  {row['download_status']:20} {row['count']:6} ({percentage:5.1f}%)")
-        print()
+            out.append(f"  {row['label']:20} {row['count']:6} ({percentage:5.1f}%)")
+        out.append("")
         
-        # By category
-        print("Top 10 Categories:")
-        cursor = conn.execute("""
-            SELECT category, COUNT(*) as count 
-            FROM skins 
-            GROUP BY category 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        for row in cursor:
-            print(f"  {row['category']:30} {row['count']:6}")
-        print()
+        out.append("Top 10 Categories:")
+        for row in sections['category']:
+            out.append(f"  {row['label']:30} {row['count']:6}")
+        out.append("")
         
-        # Top authors
-        print("Top 10 Authors:")
-        cursor = conn.execute("""
-            SELECT author, COUNT(*) as count 
-            FROM skins 
-            WHERE author != 'Unknown Author'
-            GROUP BY author 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        for row in cursor:
-            print(f"  {row['author']:30} {row['count']:6}")
-        print()
+        out.append("Top 10 Authors:")
+        for row in sections['author']:
+            out.append(f"  {row['label']:30} {row['count']:6}")
+        out.append("")
         
-        # Recent additions
-        print("Most Recently Scraped (Last 5):")
-        cursor = conn.execute("""
-            SELECT title, category, scraped_at 
-            FROM skins 
-            ORDER BY scraped_at DESC 
-            LIMIT 5
-        """)
-        for row in cursor:
-            print(f"  {row['title'][:40]:40} [{row['category']}]")
-        print()
+        out.append("Most Recently Scraped (Last 5):")
+        for row in sections['recent']:
+            out.append(f"  {row['label'][:40]:40} [{row['detail']}]")
+        out.append("")
         
-        conn.close()
+        sys.stdout.write("\n".join(out) + "\n")
     
     def reset(self, category=None, status=None):
         """Reset download status"""
-        conn = self.get_connection()
-        
         if category:
             print(f"Resetting skins in category: {category}")
-            cursor = conn.execute("""
+            sql, params = """
                 UPDATE skins 
                 SET download_status = 'pending', 
                     local_path = '', 
                     extracted_path = '', 
                     file_hash = ''
                 WHERE category = ?
-            """, (category,))
+            """ + self.RESET_NEEDED, (category,)
         elif status:
             print(f"Resetting skins with status: {status}")
-            cursor = conn.execute("""
+            sql, params = """
                 UPDATE skins 
                 SET download_status = 'pending', 
                     local_path = '', 
                     extracted_path = '', 
                     file_hash = ''
                 WHERE download_status = ?
-            """, (status,))
+            """ + self.RESET_NEEDED, (status,)
         else:
             print("Error: Specify --category or --status")
-            conn.close()
             return
         
-        count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        conn = self.get_connection()
+        # Take the write lock up front; the context manager commits or rolls back
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            count = conn.execute(sql, params).rowcount
+        
+        # A bulk reset reshapes the download_status distribution; refresh its stats
+        if count:
+            conn.execute("ANALYZE skins")
+        self.close_connection(conn)
         
         print(f"✅ Reset {count} skins to pending status")
         print("Run scraper with --resume to re-download")
     
-    def export(self, format='json', output=None):
+    def export(self, format='json', output=None, pretty=False):
         """Export data in various formats"""
-        conn = self.get_connection()
+        conn = self.get_connection(read_only=True)
         
         if output is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -144,23 +370,32 @@ class AXIOMUtilities:
         print(f"Exporting to {output}...")
         
         if format == 'json':
-            cursor = conn.execute("SELECT * FROM skins")
-            skins = [dict(row) for row in cursor.fetchall()]
+            # Stream rows out in batches rather than materializing the table;
+            # plain tuples zipped with the column names skip sqlite3.Row
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.arraysize = self.EXPORT_BATCH_SIZE
+            cursor.execute("SELECT * FROM skins")
+            keys = [column[0] for column in cursor.description]
             
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(skins, f, indent=2, ensure_ascii=False)
+            with open(output, 'wb') as f:
+                f.write(b'[')
+                separator = b'\n'
+                for rows in iter(cursor.fetchmany, []):
+                    for row in rows:
+                        f.write(separator + _dumps(dict(zip(keys, row)), pretty))
+                        separator = b',\n'
+                f.write(b'\n]\n')
         
         elif format == 'csv':
             import csv
             cursor = conn.execute("SELECT * FROM skins")
-            rows = cursor.fetchall()
             
-            if rows:
-                with open(output, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-                    writer.writeheader()
-                    for row in rows:
-                        writer.writerow(dict(row))
+            # Rows are sequences, so csv.writer consumes the cursor directly
+            with open(output, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow([column[0] for column in cursor.description])
+                writer.writerows(cursor)
         
         elif format == 'txt':
             cursor = conn.execute("SELECT * FROM skins")
@@ -175,81 +410,114 @@ class AXIOMUtilities:
         
         else:
             print(f"Unsupported format: {format}")
-            conn.close()
+            self.close_connection(conn)
             return
         
-        conn.close()
+        self.close_connection(conn)
         print(f"✅ Exported to {output}")
     
     def search(self, query, field='title'):
-        """Search for skins"""
-        conn = self.get_connection()
+        """Search for skins
+        
+        Text fields go through the FTS5 index and match whole words or word
+        prefixes ('weath' finds "Weather", 'ather' does not); url, and every
+        field when FTS5 is unavailable, uses a substring LIKE match.
+        """
+        if field not in self.LIKE_SEARCH_SQL:
+            raise ValueError(f"Unsupported search field: {field}")
+        
+        # Created on first use so read-only commands never write to the file
+        self.ensure_indexes('idx_title_nocase')
+        fts_available = self.ensure_search_index()
+        
+        conn = self.get_connection(read_only=True)
         
         print(f"\nSearching {field} for: {query}")
         print("=" * 70)
         
-        cursor = conn.execute(f"""
-            SELECT title, author, category, download_status, url 
-            FROM skins 
-            WHERE {field} LIKE ? 
-            ORDER BY title
-        """, (f"%{query}%",))
+        match = self.fts_query(query, field) if field in self.FTS_COLUMNS else None
+        
+        if fts_available and match:
+            cursor = conn.execute("""
+                SELECT s.title, s.author, s.category, s.download_status, s.url 
+                FROM skins_fts f 
+                JOIN skins s ON s.rowid = f.rowid 
+                WHERE skins_fts MATCH ? 
+                ORDER BY rank
+            """, (match,))
+        else:
+            cursor = conn.execute(self.LIKE_SEARCH_SQL[field], (f"%{query}%",))
         
         results = cursor.fetchall()
         
         if results:
-            print(f"\nFound {len(results)} results:\n")
+            # One write for the whole listing; wide searches return thousands of rows
+            out = ["", f"Found {len(results)} results:", ""]
             for row in results:
-                status_icon = {
-                    'pending': '⏳',
-                    'downloaded': '📥',
-                    'extracted': '✅',
-                    'download_failed': '❌',
-                    'extraction_failed': '⚠️'
-                }.get(row['download_status'], '❓')
-                
-                print(f"{status_icon} {row['title']}")
-                print(f"   Author: {row['author']}")
-                print(f"   Category: {row['category']}")
-                print(f"   URL: {row['url']}")
-                print()
+                status_icon = self.STATUS_ICONS.get(row['download_status'], '❓')
+                out.append(f"{status_icon} {row['title']}")
+                out.append(f"   Author: {row['author']}")
+                out.append(f"   Category: {row['category']}")
+                out.append(f"   URL: {row['url']}")
+                out.append("")
+            sys.stdout.write("\n".join(out) + "\n")
         else:
             print("No results found")
         
-        conn.close()
+        self.close_connection(conn)
     
     def cleanup(self):
         """Clean up orphaned files"""
         print("🧹 Cleaning up orphaned files...")
         
-        conn = self.get_connection()
-        cursor = conn.execute("SELECT local_path FROM skins WHERE local_path != ''")
-        db_files = {row['local_path'] for row in cursor.fetchall()}
-        conn.close()
-        
         # Check downloads directory
         downloads_dir = self.db_path.parent / "downloads"
         if not downloads_dir.exists():
             print("Downloads directory not found")
             return
         
-        orphaned = []
-        for file_path in downloads_dir.rglob("*"):
-            if file_path.is_file():
-                if str(file_path) not in db_files:
-                    orphaned.append(file_path)
+        root = os.path.abspath(downloads_dir)
+        self.ensure_indexes('idx_local_path')
+        
+        # Let SQLite anti-join the walked files against skins.local_path rather
+        # than pulling both into Python sets. The scraper may have recorded
+        # relative paths, so local_path is made absolute (from the current
+        # directory, as the scraper's own paths are) before comparing.
+        conn = self.get_connection()
+        conn.create_function('abspath', 1, os.path.abspath, deterministic=True)
+        conn.execute("CREATE TEMP TABLE fs_paths (path TEXT PRIMARY KEY)")
+        conn.execute("CREATE TEMP TABLE db_paths (path TEXT PRIMARY KEY)")
+        conn.executemany(
+            "INSERT OR IGNORE INTO fs_paths VALUES (?)",
+            ((file_path,) for file_path in _walk_parallel(root))
+        )
+        # local_path > '' skips NULL and '' as a range scan of idx_local_path
+        conn.execute("""
+            INSERT OR IGNORE INTO db_paths 
+            SELECT abspath(local_path) FROM skins WHERE local_path > ''
+        """)
+        cursor = conn.execute("""
+            SELECT path FROM fs_paths 
+            WHERE NOT EXISTS (SELECT 1 FROM db_paths WHERE db_paths.path = fs_paths.path)
+        """)
+        orphaned = [row['path'] for row in cursor]
+        conn.execute("DROP TABLE fs_paths")
+        conn.execute("DROP TABLE db_paths")
+        conn.commit()
+        self.close_connection(conn)
         
         if orphaned:
             print(f"\nFound {len(orphaned)} orphaned files:")
             for path in orphaned[:10]:  # Show first 10
-                print(f"  - {path.name}")
+                print(f"  - {os.path.basename(path)}")
             if len(orphaned) > 10:
                 print(f"  ... and {len(orphaned) - 10} more")
             
             response = input("\nDelete orphaned files? (y/n): ")
             if response.lower() == 'y':
-                for path in orphaned:
-                    path.unlink()
+                # Unlinks are I/O-bound syscalls; overlap them on a thread pool
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    list(pool.map(_unlink_missing_ok, orphaned))
                 print(f"✅ Deleted {len(orphaned)} orphaned files")
             else:
                 print("Cleanup cancelled")
@@ -265,7 +533,31 @@ class AXIOMUtilities:
         backup_path = backup_dir / f"skins_backup_{timestamp}.db"
         
         print(f"Creating backup: {backup_path}")
-        shutil.copy2(self.db_path, backup_path)
+        
+        # Online backup API: consistent even with WAL or concurrent writers.
+        # Written to a temp file and renamed so a crash never leaves a partial .db
+        tmp_path = backup_path.with_suffix('.tmp')
+        src = self.get_connection(read_only=True)
+        dst = sqlite3.connect(tmp_path)
+        try:
+            try:
+                src.backup(
+                    dst,
+                    pages=1024,
+                    progress=lambda status, remaining, total: print(
+                        f"  {total - remaining}/{total} pages", end='\r'
+                    )
+                )
+            finally:
+                dst.close()
+                self.close_connection(src)
+            os.replace(tmp_path, backup_path)
+        except BaseException:
+            # Don't leave a half-written copy next to the real backups
+            _unlink_missing_ok(tmp_path)
+            raise
+        
+        print()
         print(f"✅ Backup created successfully")
         print(f"   Size: {backup_path.stat().st_size / (1024*1024):.2f} MB")
     
@@ -273,7 +565,7 @@ class AXIOMUtilities:
         """Check database integrity"""
         print("🔍 Checking database integrity...")
         
-        conn = self.get_connection()
+        conn = self.get_connection(read_only=True)
         
         # SQLite integrity check
         cursor = conn.execute("PRAGMA integrity_check")
@@ -284,33 +576,58 @@ class AXIOMUtilities:
         else:
             print(f"❌ Database integrity issues: {result}")
         
-        # Check for nulls in required fields
-        cursor = conn.execute("""
-            SELECT COUNT(*) FROM skins 
-            WHERE url IS NULL OR title IS NULL OR category IS NULL
-        """)
-        null_count = cursor.fetchone()[0]
+        # Check for nulls in required fields. Columns declared NOT NULL can't
+        # hold one; the rest (the url primary key) are checked via their index.
+        nullable = [
+            row['name'] for row in conn.execute("PRAGMA table_info(skins)")
+            if row['name'] in self.REQUIRED_FIELDS and not row['notnull']
+        ]
+        null_count = 0
+        if nullable:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM skins WHERE "
+                + " OR ".join(f"{name} IS NULL" for name in nullable)
+            )
+            null_count = cursor.fetchone()[0]
         
         if null_count > 0:
             print(f"⚠️  Found {null_count} records with NULL required fields")
         else:
             print("✅ All required fields populated")
         
-        # Check for duplicate URLs
-        cursor = conn.execute("""
-            SELECT url, COUNT(*) as count 
-            FROM skins 
-            GROUP BY url 
-            HAVING count > 1
-        """)
-        duplicates = cursor.fetchall()
-        
-        if duplicates:
-            print(f"⚠️  Found {len(duplicates)} duplicate URLs")
+        # Check for duplicate URLs. A unique index on url (the primary key in
+        # the scraper's schema) rules them out, and integrity_check above has
+        # already verified that index, so only scan when there isn't one.
+        if self._has_unique_index(conn, 'url'):
+            duplicate_count = 0
+        else:
+            cursor = conn.execute("""
+                SELECT COUNT(*) FROM (
+                    SELECT url FROM skins 
+                    GROUP BY url 
+                    HAVING COUNT(*) > 1
+                )
+            """)
+            duplicate_count = cursor.fetchone()[0]
+        
+        if duplicate_count:
+            print(f"⚠️  Found {duplicate_count} duplicate URLs")
         else:
             print("✅ No duplicate URLs")
         
-        conn.close()
+        self.close_connection(conn)
+    
+    @staticmethod
+    def _has_unique_index(conn, column):
+        """Whether skins has a unique index on exactly this column"""
+        for index in conn.execute("PRAGMA index_list(skins)"):
+            if index['unique']:
+                columns = [
+                    info['name'] for info in conn.execute(f"PRAGMA index_info({index['name']})")
+                ]
+                if columns == [column]:
+                    return True
+        return False
     
     def vacuum(self):
         """Compact database"""
@@ -320,7 +637,7 @@ class AXIOMUtilities:
         
         conn = self.get_connection()
         conn.execute("VACUUM")
-        conn.close()
+        self.close_connection(conn)
         
         after_size = self.db_path.stat().st_size
         saved = before_size - after_size
@@ -341,6 +658,8 @@ Examples:
   axiom_utils.py stats                    Show statistics
   axiom_utils.py export --format json     Export to JSON
   axiom_utils.py search "weather"         Search for weather skins
+                                          (matches words or word prefixes,
+                                          not substrings; --field url does)
   axiom_utils.py reset --status failed    Reset failed downloads
   axiom_utils.py backup                   Create database backup
   axiom_utils.py cleanup                  Clean orphaned files
@@ -358,12 +677,15 @@ Examples:
     export_parser = subparsers.add_parser('export', help='Export data')
     export_parser.add_argument('--format', choices=['json', 'csv', 'txt'], default='json')
     export_parser.add_argument('--output', help='Output filename')
+    export_parser.add_argument('--pretty', action='store_true', help='Indent JSON output')
     
     # Search command
-    search_parser = subparsers.add_parser('search', help='Search for skins')
+    search_parser = subparsers.add_parser(
+        'search', help='Search for skins (word/prefix match; substring for --field url)'
+    )
     search_parser.add_argument('query', help='Search query')
     search_parser.add_argument('--field', default='title', 
-                              choices=['title', 'author', 'category', 'description'])
+                              choices=['title', 'author', 'category', 'description', 'url'])
     
     # Reset command
     reset_parser = subparsers.add_parser('reset', help='Reset download status')
@@ -393,7 +715,7 @@ Examples:
     if args.command == 'stats':
         utils.stats()
     elif args.command == 'export':
-        utils.export(format=args.format, output=args.output)
+        utils.export(format=args.format, output=args.output, pretty=args.pretty)
     elif args.command == 'search':
         utils.search(args.query, args.field)
     elif args.command == 'reset':
@@ -1,48 +1,88 @@
 import os
 import requests
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+CHUNK_SIZE = 1 << 20
+MAX_WORKERS = 8
 
-def download_file(url, filepath, auth=None):
+# Shared session so repeated downloads from one host reuse pooled connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+
+def download_file(url, filepath, auth=None, expected_hash=None):
+    # Hash while writing so verification doesn't re-read the file from disk
+    hash_func = hashlib.sha256()
     try:
-        with requests.get(url, auth=auth, stream=True) as r:
+        with _SESSION.get(url, auth=auth, stream=True) as r:
             r.raise_for_status()
             with open(filepath, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
+                for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
                     f.write(chunk)
+                    hash_func.update(chunk)
     except requests.exceptions.RequestException as e:
         print(f"Failed to download {url}: {e}")
         return False
+    if expected_hash and hash_func.hexdigest() != expected_hash:
+        print(f"Integrity check failed for {os.path.basename(filepath)}.")
+        os.unlink(filepath)
+        return False
     return True
 
 
 def verify_integrity(filepath, expected_hash):
-    hash_func = hashlib.sha256()
     with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_func.update(chunk)
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read/update loop runs in C
+            hash_func = hashlib.file_digest(f, 'sha256')
+        else:
+            hash_func = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hash_func.update(chunk)
     return hash_func.hexdigest() == expected_hash
 
 
+def _download_and_verify(item):
+    """Download and hash-check one item
+    
+    Returns (filename, result) where result is 'verified', 'unverified'
+    (downloaded, but the item has no hash to check against) or 'failed'.
+    """
+    url = item.get('url')
+    auth = item.get('auth')
+    expected_hash = item.get('hash')
+
+    filename = url.split('/')[-1]
+    saved_filepath = os.path.join('/d/RainmeterManager/samples/', filename)
+
+    if not download_file(url, saved_filepath, auth, expected_hash):
+        return filename, 'failed'
+    return filename, 'verified' if expected_hash else 'unverified'
+
+
 def main():
     urls = [
         # Example URL and authentication details
         # {'url': 'http://example.com/file.rmskin', 'auth': ('user', 'pass'), 'hash': 'expectedhashhere'}
     ]
 
-    for item in urls:
-        url = item.get('url')
-        auth = item.get('auth')
-        expected_hash = item.get('hash')
-
-        filename = url.split('/')[-1]
-        saved_filepath = os.path.join('/d/RainmeterManager/samples/', filename)
-
-        if download_file(url, saved_filepath, auth):
-            if verify_integrity(saved_filepath, expected_hash):
+    # Downloads are I/O-bound; threads overlap them and share _SESSION's pool
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(_download_and_verify, item) for item in urls]
+        for future in as_completed(futures):
+            filename, result = future.result()
+            if result == 'verified':
                 print(f"{filename} downloaded and verified successfully.")
-            else:
-                print(f"Integrity check failed for {filename}.")
+            elif result == 'unverified':
+                print(f"{filename} downloaded (not verified: no expected hash).")
 
 
 if __name__ == "__main__":